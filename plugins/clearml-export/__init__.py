@@ -8,6 +8,9 @@ import fiftyone as fo
 import fiftyone.operators as foo
 import fiftyone.operators.types as types
 import fiftyone.types.dataset_types as fodt
+import fiftyone.core.labels as fol
+
+from .instrumentation import Instrumentation, get_directory_size
 
 EXPORT_FORMATS = [
     fodt.ImageDirectory,
@@ -33,6 +36,24 @@ SUPPORT_SPLITS = [
     fodt.YOLOv5Dataset
 ]
 
+# Formats that export every field of the samples instead of a single label field
+FULL_EXPORT_FORMATS = [
+    fodt.FiftyOneDataset
+]
+
+LABEL_PATHS = {
+    fol.Classification : "label",
+    fol.Detection : "label",
+    fol.Polyline : "label",
+    fol.Keypoint : "label",
+    fol.TemporalDetection : "label",
+    fol.Classifications : "classifications.label",
+    fol.Detections : "detections.label",
+    fol.Polylines : "polylines.label",
+    fol.Keypoints : "keypoints.label",
+    fol.TemporalDetections : "detections.label",
+}
+
 class ExportToClearml(foo.Operator):
     
     client = None
@@ -72,6 +93,7 @@ class ExportToClearml(foo.Operator):
         return types.Property(inputs, view = types.View(label="Simple dataset input example"))
 
     def execute(self, ctx):
+        metrics = Instrumentation(ctx, self.config.name)
         
         with tempfile.TemporaryDirectory() as temp_dir:
             #--- Export to filesystem
@@ -83,23 +105,38 @@ class ExportToClearml(foo.Operator):
             if ctx.params.get("use_view", False):
                 dataset = ctx.view
             
+            dataset = project_export_view(dataset, label_field, export_format)
+            
             if export_splits is None:
-                dataset.export(
-                    export_dir=temp_dir,
-                    dataset_type=export_format,
-                    label_field=label_field)
-            else:
-                classes = get_classes(dataset, label_field)
-                export_splits = export_splits.split(',')
+                num_samples = dataset.count()
                 
-                for export_split in export_splits:
-                    split_view = dataset.match_tags(export_split)
-                    split_view.export(
+                with metrics.phase("export") as export_phase:
+                    dataset.export(
                         export_dir=temp_dir,
                         dataset_type=export_format,
-                        label_field=label_field,
-                        split=export_split,
-                        classes = classes)
+                        label_field=label_field)
+                    export_phase.add(items=num_samples)
+            else:
+                with metrics.phase("classes") as phase:
+                    classes = get_classes(dataset, label_field)
+                    phase.add(items=len(classes or []))
+                
+                split_views = {export_split : dataset.match_tags(export_split) for export_split in export_splits.split(',')}
+                split_counts = {export_split : split_view.count() for export_split, split_view in split_views.items()}
+                
+                with metrics.phase("export", total=sum(split_counts.values())) as export_phase:
+                    for export_split, split_view in split_views.items():
+                        split_view.export(
+                            export_dir=temp_dir,
+                            dataset_type=export_format,
+                            label_field=label_field,
+                            split=export_split,
+                            classes = classes)
+                        export_phase.add(items=split_counts[export_split])
+            
+            # Measured outside the timed phases and shared by export and add_files
+            export_size = get_directory_size(temp_dir)
+            export_phase.add(bytes=export_size)
                 
             #--- Upload to ClearML
             dataset_name = ctx.params['dataset_name']
@@ -116,14 +153,22 @@ class ExportToClearml(foo.Operator):
                 output_uri=ctx.secrets.get('FIFTYONE_CLEARML_FILES_STORAGE', 'files_server')
             )
             
-            dataset.add_files(path=temp_dir)
-            dataset.upload()
-            dataset.finalize()
+            with metrics.phase("add_files") as phase:
+                num_files = dataset.add_files(path=temp_dir)
+                # Source bytes on disk; what ClearML sends after compression is not exposed
+                phase.add(items=num_files or 0, bytes=export_size)
+            
+            with metrics.phase("upload"):
+                dataset.upload()
+            
+            with metrics.phase("finalize"):
+                dataset.finalize()
             
-            return {"status" : "Dataset uploaded!"}
+            return {"status" : "Dataset uploaded!", "metrics" : metrics.finish()}
 
     def resolve_output(self, ctx):
         outputs = types.Object()
+        outputs.obj("metrics", label="Metrics", view=types.JSONView())
         return types.Property(outputs, view = types.View(label="Dataset uploaded!"))
 
 def register(p):
@@ -263,17 +308,30 @@ def choose_splits_to_export(inputs, ctx):
     
     return export_splits
 
+def project_export_view(dataset, label_field, export_format):
+    # Full-fidelity formats write every field, so projecting them would silently
+    # drop the other label fields, embeddings and custom fields from the export
+    if export_format in FULL_EXPORT_FORMATS:
+        return dataset
+    
+    # select_fields() always keeps the default fields (id, filepath, tags, metadata),
+    # so the exporter and split matching see everything they need and nothing else
+    return dataset.select_fields(label_field)
+
 def get_classes(dataset, label_field):
-    classes = []
-    for sample in dataset:
-        if label_field in sample and sample[label_field] is not None:
-            sample_values = sample[label_field].to_dict().values()
-            if len(sample_values) > 1:
-                for instance in sample_values[1]:
-                    if instance is not None and 'label' in instance.to_dict():
-                        classes.append(instance.to_dict()['label'])
-        
-    return list(set(classes))
+    # None lets the exporter build the class list itself; an empty list would
+    # tell it that no class is valid and drop every label
+    label_type = getattr(dataset.get_field(label_field), "document_type", None)
+    if not isinstance(label_type, type):
+        return None
+    
+    label_paths = [path for base_type, path in LABEL_PATHS.items() if issubclass(label_type, base_type)]
+    if not label_paths:
+        return None
+    
+    label_path = f"{label_field}.{label_paths[0]}"
+    
+    return sorted(label for label in dataset.distinct(label_path) if label is not None)
 
 def parse_fiftyone_inputs(inputs, ctx):
     
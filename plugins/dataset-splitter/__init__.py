@@ -1,9 +1,12 @@
+import os
 import hashlib
 
 import fiftyone as fo
 import fiftyone.operators as foo
 import fiftyone.operators.types as types
 
+from .instrumentation import Instrumentation
+
 class DatasetSplitter(foo.Operator):
     @property
     def config(self):
@@ -34,6 +37,7 @@ class DatasetSplitter(foo.Operator):
         return types.Property(inputs, view = types.View(label="Simple dataset input example"))
     
     def execute(self, ctx):
+        metrics = Instrumentation(ctx, self.config.name)
         use_view = ctx.params.get('use_view', False)
         
         if use_view:
@@ -53,19 +57,24 @@ class DatasetSplitter(foo.Operator):
         except Exception as e:
             raise ValueError(f"Error parsing split names and ratios: {e}")
         
+        num_samples = dataset.count()
         split_counter = {split_name: 0 for split_name in split_names}
         for sample in dataset:
-            sample_hash = compute_hash(sample.filepath)
-            split_name = get_split_by_hash(sample_hash, split_names, split_probs.copy())
+            with metrics.phase("hashing", total=num_samples) as phase:
+                sample_hash = compute_hash(sample.filepath)
+                split_name = get_split_by_hash(sample_hash, split_names, split_probs.copy())
+                phase.add(items=1, bytes=os.path.getsize(sample.filepath))
             
             if split_name not in sample.tags:
                 sample.tags.append(split_name)
             
             split_counter[split_name] += 1
             
-            sample.save()
+            with metrics.phase("db_writes", total=num_samples) as phase:
+                sample.save()
+                phase.add(items=1)
         
-        return {"split_counts" : str(split_counter)}
+        return {"split_counts" : str(split_counter), "metrics" : metrics.finish()}
 
     def resolve_output(self, ctx):
         outputs = types.Object()
@@ -73,6 +82,7 @@ class DatasetSplitter(foo.Operator):
             'split_counts',
             label='Split counts',
         )
+        outputs.obj('metrics', label='Metrics', view=types.JSONView())
         return types.Property(outputs, view = types.View(label="Dataset uploaded!"))
 
 def register(p):
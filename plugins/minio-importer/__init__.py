@@ -6,6 +6,8 @@ import fiftyone.operators as foo
 import fiftyone.operators.types as types
 import fiftyone.types.dataset_types as fodt
 
+from .instrumentation import Instrumentation
+
 class ImportFromMinio(foo.Operator):
     
     client = None
@@ -42,6 +44,7 @@ class ImportFromMinio(foo.Operator):
         return types.Property(inputs, view = types.View(label="Import from Minio"))
 
     def execute(self, ctx):
+        metrics = Instrumentation(ctx, self.config.name)
         bucket = ctx.params.get('bucket')
         path_to_folder = ctx.params.get('path_to_folder')
         
@@ -53,26 +56,32 @@ class ImportFromMinio(foo.Operator):
         else:
             extraction_path = save_path_directory
         
-        found_objects = [obj for obj in self.client.list_objects(bucket, prefix=path_to_folder, recursive=True)]
-        for obj in found_objects:
-            minio_object_path = obj.object_name
-            
-            parts_to_trunc = len([part for part in path_to_folder.split('/') if part])
-            minio_object_path_trunc = '/'.join(minio_object_path.split('/')[parts_to_trunc:])
-            
-            save_object_path = os.path.join(extraction_path, minio_object_path_trunc)
-            
-            if not os.path.exists(os.path.dirname(save_object_path)):
-                os.makedirs(os.path.dirname(save_object_path))
-            
-            self.client.fget_object(bucket, minio_object_path, save_object_path)
+        with metrics.phase("listing") as phase:
+            found_objects = [obj for obj in self.client.list_objects(bucket, prefix=path_to_folder, recursive=True)]
+            phase.add(items=len(found_objects))
+        
+        with metrics.phase("download", total=len(found_objects)) as phase:
+            for obj in found_objects:
+                minio_object_path = obj.object_name
+                
+                parts_to_trunc = len([part for part in path_to_folder.split('/') if part])
+                minio_object_path_trunc = '/'.join(minio_object_path.split('/')[parts_to_trunc:])
+                
+                save_object_path = os.path.join(extraction_path, minio_object_path_trunc)
+                
+                if not os.path.exists(os.path.dirname(save_object_path)):
+                    os.makedirs(os.path.dirname(save_object_path))
+                
+                self.client.fget_object(bucket, minio_object_path, save_object_path)
+                phase.add(items=1, bytes=obj.size or 0)
         
-        return {"status" : f"Imported {len(found_objects)}!"}
+        return {"status" : f"Imported {len(found_objects)}!", "metrics" : metrics.finish()}
 
     def resolve_output(self, ctx):
         
         outputs = types.Object()
         outputs.str("status", label="Status", required=True)
+        outputs.obj("metrics", label="Metrics", view=types.JSONView())
         
         return types.Property(outputs, view = types.View(label="Dataset imported from Minio!"))
 
@@ -7,6 +7,8 @@ import fiftyone as fo
 import fiftyone.operators as foo
 import fiftyone.operators.types as types
 
+from .instrumentation import Instrumentation
+
 class ZipExtractor(foo.Operator):
     @property
     def config(self):
@@ -53,9 +55,12 @@ class ZipExtractor(foo.Operator):
         return types.Property(inputs, view = types.View(label="Import a zip file"))
         
     def execute(self, ctx):
+        metrics = Instrumentation(ctx, self.config.name)
         
         zip_fileobj = ctx.params['zip_file']
-        content = base64.b64decode(zip_fileobj["content"])
+        with metrics.phase("decoding") as phase:
+            content = base64.b64decode(zip_fileobj["content"])
+            phase.add(bytes=len(content))
         
         directory = ctx.params['directory']
         folder_name = ctx.params.get('folder_name', None)
@@ -68,19 +73,28 @@ class ZipExtractor(foo.Operator):
         if not os.path.exists(extraction_path):
             os.makedirs(extraction_path)
         
-        extract_zip_file(content, extraction_path)
+        with metrics.phase("extraction") as phase:
+            extract_zip_file(content, extraction_path, phase)
         
-        return {'message' : f'Zip content extracted in {extraction_path}'}
+        return {'message' : f'Zip content extracted in {extraction_path}', 'metrics' : metrics.finish()}
         
     def resolve_output(self, ctx):
         outputs = types.Object()
         outputs.str('message', label='Message', required=True)
+        outputs.obj('metrics', label='Metrics', view=types.JSONView())
         
         return types.Property(outputs, view = types.View(label="Dataset uploaded!"))
     
 def register(p):
     p.register(ZipExtractor)
     
-def extract_zip_file(content, directory):
+def extract_zip_file(content, directory, phase=None):
     with zipfile.ZipFile(io.BytesIO(content)) as zip_ref:
-        zip_ref.extractall(directory)
\ No newline at end of file
+        members = zip_ref.infolist()
+        if phase is not None:
+            phase.total = len(members)
+        
+        for member in members:
+            zip_ref.extract(member, directory)
+            if phase is not None:
+                phase.add(items=1, bytes=member.file_size)
\ No newline at end of file
@@ -0,0 +1,268 @@
+"""Per-phase timing and throughput instrumentation for the plugin operators.
+
+Every plugin is downloaded and installed on its own, so this file is kept
+identical in each plugin folder instead of being imported from a shared one.
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+METRICS_DIR_SECRET = 'FIFTYONE_PLUGINS_METRICS_DIR'
+PROGRESS_INTERVAL = 1.0
+RSS_SAMPLE_INTERVAL = 0.1
+
+logger = logging.getLogger(__name__)
+
+class Phase:
+
+    def __init__(self, name, instrumentation):
+        self.name = name
+        self.instrumentation = instrumentation
+        self.wall_time = 0.0
+        self.entered_at = None
+        self.items = 0
+        self.bytes = 0
+        self.total = None
+        self.peak_rss = None
+
+    def add(self, items=0, bytes=0):
+        self.items += items
+        self.bytes += bytes
+        self.instrumentation.report_progress(self)
+
+    def sample_rss(self):
+        rss = get_current_rss()
+        if rss is not None and (self.peak_rss is None or rss > self.peak_rss):
+            self.peak_rss = rss
+
+    def is_complete(self):
+        return self.total is None or self.items >= self.total
+
+    def elapsed(self):
+        """Wall time of the finished entries plus the one that is still open."""
+        if self.entered_at is None:
+            return self.wall_time
+        return self.wall_time + time.perf_counter() - self.entered_at
+
+    def items_per_sec(self):
+        elapsed = self.elapsed()
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+    def bytes_per_sec(self):
+        elapsed = self.elapsed()
+        return self.bytes / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self):
+        return {
+            'wall_time' : round(self.elapsed(), 6),
+            'items' : self.items,
+            'bytes' : self.bytes,
+            'items_per_sec' : round(self.items_per_sec(), 3),
+            'bytes_per_sec' : round(self.bytes_per_sec(), 3),
+            'peak_rss' : self.peak_rss,
+        }
+
+class Instrumentation:
+
+    def __init__(self, ctx, operator_name):
+        self.ctx = ctx
+        self.operator_name = operator_name
+        self.phases = {}
+        self.current_phase = None
+        self.rss_sampler = None
+        self.rss_sampler_lock = threading.Lock()
+        self.started_at = time.perf_counter()
+        self.last_progress_at = 0.0
+
+    @contextmanager
+    def phase(self, name, total=None):
+        """Times the enclosed block and accumulates it into the phase ``name``.
+
+        Entering the same phase several times (f.e. once per sample) adds up
+        wall time, items and bytes of all the entries. The peak RSS of a phase
+        is the highest current RSS sampled while any of its entries was open.
+        """
+        if name not in self.phases:
+            self.phases[name] = Phase(name, self)
+        phase = self.phases[name]
+
+        if total is not None:
+            phase.total = total
+
+        phase.entered_at = time.perf_counter()
+        phase.sample_rss()
+        self.start_rss_sampler(phase)
+        try:
+            yield phase
+        finally:
+            # Clearing the phase stops the sampler thread on its next wake-up,
+            # also when the block raised
+            with self.rss_sampler_lock:
+                self.current_phase = None
+            phase.wall_time += time.perf_counter() - phase.entered_at
+            phase.entered_at = None
+            phase.sample_rss()
+            # Flush the final counts, which the throttle may have skipped
+            if phase.is_complete():
+                self.report_progress(phase, force=True)
+
+    def start_rss_sampler(self, phase):
+        with self.rss_sampler_lock:
+            self.current_phase = phase
+            # A sampler that saw no open phase has already cleared itself
+            if self.rss_sampler is None:
+                self.rss_sampler = threading.Thread(target=self.sample_rss, daemon=True)
+                self.rss_sampler.start()
+
+    def sample_rss(self):
+        while True:
+            time.sleep(RSS_SAMPLE_INTERVAL)
+
+            with self.rss_sampler_lock:
+                if self.current_phase is None:
+                    self.rss_sampler = None
+                    return
+                phase = self.current_phase
+
+            phase.sample_rss()
+
+    def report_progress(self, phase, force=False):
+        now = time.perf_counter()
+        if not force and now - self.last_progress_at < PROGRESS_INTERVAL:
+            return
+        self.last_progress_at = now
+
+        if phase.total:
+            progress = min(phase.items / phase.total, 1.0)
+            label = f"{phase.name}: {phase.items}/{phase.total}"
+        else:
+            progress = None
+            label = f"{phase.name}: {phase.items}"
+
+        rates = [f"{phase.items_per_sec():.1f} items/s"]
+        if phase.bytes:
+            rates.append(f"{format_bytes(phase.bytes_per_sec())}/s")
+        label += f" ({', '.join(rates)})"
+
+        self.ctx.set_progress(progress=progress, label=label)
+
+    def summary(self):
+        return {
+            'operator' : self.operator_name,
+            'wall_time' : round(time.perf_counter() - self.started_at, 6),
+            # ru_maxrss covers the whole process lifetime, which in a long-lived
+            # app or executor includes earlier runs; see the phases for this run
+            'process_peak_rss' : self.process_peak_rss(),
+            'phases' : {name : phase.to_dict() for name, phase in self.phases.items()},
+        }
+
+    def process_peak_rss(self):
+        # ru_maxrss is updated lazily by the kernel and can lag behind the RSS
+        # sampled from /proc, so it must never come out below a phase peak
+        peaks = [phase.peak_rss for phase in self.phases.values() if phase.peak_rss is not None]
+        process_peak_rss = get_process_peak_rss()
+        if process_peak_rss is not None:
+            peaks.append(process_peak_rss)
+        return max(peaks) if peaks else None
+
+    def finish(self):
+        """Returns the summary and writes it to FIFTYONE_PLUGINS_METRICS_DIR if it is set."""
+        summary = self.summary()
+
+        metrics_dir = self.ctx.secrets.get(METRICS_DIR_SECRET, None)
+        if metrics_dir:
+            # The operator's work is already done here, so a bad metrics dir
+            # must not fail the run
+            try:
+                write_metrics(summary, metrics_dir)
+            except OSError as e:
+                logger.warning("Failed to write metrics to %s: %s", metrics_dir, e)
+                summary['metrics_error'] = str(e)
+
+        return summary
+
+def get_current_rss():
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+
+    return resident_pages * os.sysconf('SC_PAGE_SIZE')
+
+def get_process_peak_rss():
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak_rss if sys.platform == 'darwin' else peak_rss * 1024
+
+def format_bytes(num_bytes):
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+def get_directory_size(directory):
+    size = 0
+    for root, _, files in os.walk(directory):
+        for file in files:
+            size += os.path.getsize(os.path.join(root, file))
+    return size
+
+def to_prometheus(summary):
+    operator = summary['operator']
+    lines = [
+        '# HELP fiftyone_plugin_wall_time_seconds Wall time of the operator run.',
+        '# TYPE fiftyone_plugin_wall_time_seconds gauge',
+        f'fiftyone_plugin_wall_time_seconds{{operator="{operator}"}} {summary["wall_time"]}',
+    ]
+
+    if summary['process_peak_rss'] is not None:
+        lines += [
+            '# HELP fiftyone_plugin_process_peak_rss_bytes Peak resident set size over the process lifetime.',
+            '# TYPE fiftyone_plugin_process_peak_rss_bytes gauge',
+            f'fiftyone_plugin_process_peak_rss_bytes{{operator="{operator}"}} {summary["process_peak_rss"]}',
+        ]
+
+    phase_metrics = [
+        ('wall_time', 'fiftyone_plugin_phase_wall_time_seconds', 'Wall time spent in the phase.'),
+        ('items', 'fiftyone_plugin_phase_items', 'Items processed in the phase.'),
+        ('bytes', 'fiftyone_plugin_phase_bytes', 'Bytes moved in the phase.'),
+        ('items_per_sec', 'fiftyone_plugin_phase_items_per_second', 'Item throughput of the phase.'),
+        ('peak_rss', 'fiftyone_plugin_phase_peak_rss_bytes', 'Peak resident set size sampled during the phase.'),
+    ]
+    for key, metric_name, metric_help in phase_metrics:
+        lines += [f'# HELP {metric_name} {metric_help}', f'# TYPE {metric_name} gauge']
+        for phase_name, phase in summary['phases'].items():
+            if phase[key] is None:
+                continue
+            lines.append(f'{metric_name}{{operator="{operator}",phase="{phase_name}"}} {phase[key]}')
+
+    return '\n'.join(lines) + '\n'
+
+def write_metrics(summary, metrics_dir):
+    if not os.path.exists(metrics_dir):
+        os.makedirs(metrics_dir)
+
+    outputs = {
+        f"{summary['operator']}.json" : json.dumps(summary, indent=2),
+        f"{summary['operator']}.prom" : to_prometheus(summary),
+    }
+    for filename, content in outputs.items():
+        # Write to a temporary file first, so scrapers never read a half-written file
+        path = os.path.join(metrics_dir, filename)
+        with open(path + '.tmp', 'w') as f:
+            f.write(content)
+        os.replace(path + '.tmp', path)